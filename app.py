@@ -1,10 +1,14 @@
 import sys
-from PyQt5 import QtWidgets 
+from PyQt5 import QtWidgets, QtCore
 from views.main_window import QuranBrowser
 from PyQt5.QtGui import QGuiApplication
 
 
 def main():
+    # Application attributes must be set before the QApplication exists
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_CompressHighFrequencyEvents)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_DontCreateNativeWidgetSiblings)
     app = QtWidgets.QApplication(sys.argv)
     app.setStyle("Fusion")
     app.setApplicationName("QuranSearch")
@@ -7,18 +7,107 @@ import os
 import sys
 import subprocess
 import shutil
+import stat
 import ctypes
+import fnmatch
+import hashlib
+import locale
 import logging
+import venv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+# Keep child processes from allocating a console window (conhost) and
+# stream their output through logging instead
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+SUBPROCESS_KW = dict(
+    shell=False,
+    close_fds=True,
+    creationflags=CREATE_NO_WINDOW,
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.PIPE,
+    stderr=subprocess.STDOUT,
+)
+
+# Entries never copied into the installation directory
+IGNORE_PATTERNS = (".git", "__pycache__", "*.pyc", "venv", "env")
+
+# Never build the Qt stack from source; prefer wheels for everything else
+PIP_BINARY_OPTIONS = [
+    "--prefer-binary",
+    "--only-binary", "PyQt5,PyQt5-Qt5,PyQt5-sip,PyQtWebEngine,PyQtWebEngine-Qt5",
+]
+
+# Win32 entry points are resolved and typed once at import
+try:
+    _IsUserAnAdmin = ctypes.windll.shell32.IsUserAnAdmin
+    _IsUserAnAdmin.restype = ctypes.c_int
+except AttributeError:
+    _IsUserAnAdmin = None
+
+# Win32 CopyFileW lets the kernel copy data and metadata in a single call
+try:
+    _CopyFileW = ctypes.windll.kernel32.CopyFileW
+    _CopyFileW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_bool]
+    _CopyFileW.restype = ctypes.c_bool
+except AttributeError:
+    _CopyFileW = None
+
+
+class COPYFILE2_EXTENDED_PARAMETERS(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", ctypes.c_uint32),
+        ("dwCopyFlags", ctypes.c_uint32),
+        ("pfCancel", ctypes.c_void_p),
+        ("pProgressRoutine", ctypes.c_void_p),
+        ("pvCallbackContext", ctypes.c_void_p),
+    ]
+
+
+# CopyFile2 (Windows 8+) can bypass the cache manager for large files
+COPY_FILE_NO_BUFFERING = 0x00001000
+LARGE_FILE_THRESHOLD = 16 * 1024 * 1024
+try:
+    _CopyFile2 = ctypes.windll.kernel32.CopyFile2
+    _CopyFile2.argtypes = [
+        ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.POINTER(COPYFILE2_EXTENDED_PARAMETERS)
+    ]
+    _CopyFile2.restype = ctypes.c_long
+except AttributeError:
+    _CopyFile2 = None
+
+
+def run_command(args):
+    """Run a command without a shell or console window, raising on failure"""
+    args = [str(arg) for arg in args]
+    with subprocess.Popen(args, text=True, errors="replace", **SUBPROCESS_KW) as process:
+        for line in process.stdout:
+            line = line.rstrip()
+            if line:
+                logging.info(line)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args)
+    return process.returncode
+
+def write_file(path, data):
+    """Write bytes to path with a single os.write, bypassing text-mode I/O"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 def is_admin():
     """Check if running with administrator privileges"""
+    if _IsUserAnAdmin is None:
+        return False
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
+        return bool(_IsUserAnAdmin())
+    except OSError:
         return False
 
 def get_install_path():
@@ -28,22 +117,75 @@ def get_install_path():
     else:
         return Path(os.environ["APPDATA"]) / "Quran Search"
 
+def get_wheel_cache_path():
+    """Get the persistent pip cache shared by every install on this machine"""
+    local_appdata = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    return Path(local_appdata) / "Quran Search" / "pip-cache"
+
+def find_uv():
+    """Locate a uv executable shipped next to the installer or on PATH"""
+    bundled = Path(__file__).parent / "uv.exe"
+    if bundled.exists():
+        return bundled
+    return shutil.which("uv")
+
 def create_virtualenv(venv_path):
     """Create virtual environment with improved error handling"""
+    uv_exe = find_uv()
+    if uv_exe:
+        try:
+            # --seed installs pip so the rest of the installer works unchanged
+            run_command([uv_exe, "venv", "--seed", "--python", sys.executable, venv_path])
+            logging.info(f"Created virtual environment at {venv_path} using uv")
+            return True
+        except (OSError, subprocess.CalledProcessError) as e:
+            logging.warning(f"uv venv failed, falling back to the venv module: {e}")
     try:
-        subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
+        # Build the venv in this process rather than paying for a second interpreter start
+        venv.EnvBuilder(with_pip=True).create(str(venv_path))
         logging.info(f"Created virtual environment at {venv_path}")
         return True
-    except subprocess.CalledProcessError as e:
+    except (OSError, subprocess.CalledProcessError) as e:
         logging.error(f"Virtual environment creation failed: {e}")
         return False
 
-def install_packages(venv_path, packages):
+def parse_requirements(req_text):
+    """Return the requirement specifiers listed in requirements file content"""
+    requirements = []
+    for line in req_text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            requirements.append(line)
+    return requirements
+
+
+def download_packages(packages, wheel_dir, max_workers=4):
+    """Prefetch packages into wheel_dir with several concurrent pip downloads"""
+    chunks = [packages[i::max_workers] for i in range(max_workers) if packages[i::max_workers]]
+
+    def download(chunk):
+        # requirements.txt pins the full closure; without --no-deps every chunk would
+        # resolve (and concurrently write) the whole PyQt5 dependency tree again
+        run_command([sys.executable, "-m", "pip", "download", "--no-deps", *PIP_BINARY_OPTIONS,
+                     "--cache-dir", wheel_dir, "--find-links", wheel_dir, "--dest", wheel_dir] + chunk)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(chunks) or 1) as executor:
+            for future in [executor.submit(download, chunk) for chunk in chunks]:
+                future.result()
+        return True
+    except (OSError, subprocess.CalledProcessError) as e:
+        logging.warning(f"Parallel package download failed, pip will fetch directly: {e}")
+        return False
+
+
+def install_packages(python_exe, packages, wheel_dir=None):
     """Install packages with retry logic using python -m pip."""
-    python_exe = venv_path / "Scripts" / "python.exe"
+    find_links = ["--cache-dir", str(wheel_dir), "--find-links", str(wheel_dir)] if wheel_dir else []
+    command = [str(python_exe), "-m", "pip", "install"] + PIP_BINARY_OPTIONS + find_links + packages
     for attempt in range(2):
         try:
-            subprocess.run([str(python_exe), "-m", "pip", "install"] + packages, check=True)
+            run_command(command)
             logging.info(f"Installed packages: {', '.join(packages)}")
             return True
         except subprocess.CalledProcessError as e:
@@ -51,24 +193,171 @@ def install_packages(venv_path, packages):
     return False
 
 
-def create_desktop_shortcut(target, icon=None):
-    """Create desktop shortcut using VBScript as fallback"""
-    desktop = Path.home() / "Desktop"
+def link_or_copy(src, dst, src_stat=None):
+    """Hardlink src to dst, replacing any previous file; copy if linking fails"""
+    try:
+        if os.path.lexists(dst):
+            if os.path.samefile(src, dst):
+                return dst
+            os.unlink(dst)
+        # os.link is CreateHardLinkW on Windows: a metadata-only operation
+        os.link(src, dst)
+    except OSError:
+        # Read-only source, filesystem without hardlinks, ... fall back to a real copy
+        fast_copy(src, dst, src_stat)
+    return dst
+
+
+def fast_copy(src, dst, src_stat=None):
+    """Copy a file with CopyFile2/CopyFileW where available, shutil.copy2 elsewhere
+
+    When the caller already holds the source's stat result (from os.scandir),
+    the metadata is applied from it instead of stat-ing the source again.
+    """
+    if _CopyFileW is None:
+        if src_stat is None:
+            return shutil.copy2(src, dst)
+        shutil.copyfile(src, dst)
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+        return dst
+    size = src_stat.st_size if src_stat is not None else os.path.getsize(src)
+    if _CopyFile2 is not None and size >= LARGE_FILE_THRESHOLD:
+        params = COPYFILE2_EXTENDED_PARAMETERS(
+            ctypes.sizeof(COPYFILE2_EXTENDED_PARAMETERS), COPY_FILE_NO_BUFFERING, None, None, None
+        )
+        hresult = _CopyFile2(str(src), str(dst), ctypes.byref(params))
+        if hresult < 0:
+            raise ctypes.WinError(hresult & 0xFFFF)
+        return dst
+    if not _CopyFileW(str(src), str(dst), False):
+        raise ctypes.WinError()
+    return dst
+
+
+def copy_if_changed(copy_function, src, dst, src_stat):
+    """Copy src to dst unless dst already has the same size and modification time"""
+    try:
+        dst_stat = os.stat(dst)
+        if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return dst
+    except OSError:
+        pass
+    return copy_function(src, dst, src_stat)
+
+
+def is_ignored(name):
+    """True when a directory entry matches one of IGNORE_PATTERNS"""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in IGNORE_PATTERNS)
+
+
+def copytree_multithreaded(src, dst, copy_function=fast_copy, max_workers=8):
+    """Copy a directory tree, walking it on this thread and copying files on a pool"""
+    src = os.path.abspath(src)
+    dst = os.path.abspath(dst)
+    futures = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = [(src, dst)]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            os.makedirs(dst_dir, exist_ok=True)
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    # Never descend into the destination (installing into a subfolder of the source)
+                    if is_ignored(entry.name) or entry.path == dst:
+                        continue
+                    target = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        pending.append((entry.path, target))
+                    else:
+                        # entry.stat() is cached by scandir; hand it down to avoid re-stat-ing
+                        futures.append(executor.submit(
+                            copy_if_changed, copy_function, entry.path, target, entry.stat()))
+    # Surface the first copy error, if any
+    for future in futures:
+        future.result()
+
+
+def copy_application_files(source_dir, install_dir):
+    """Copy the application tree, hardlinking files when both sides share a volume"""
+    if Path(source_dir).resolve() == Path(install_dir).resolve():
+        logging.info("Installer is running from the installation directory, nothing to copy")
+        return
+    same_volume = os.stat(source_dir).st_dev == os.stat(install_dir).st_dev
+    copytree_multithreaded(
+        source_dir,
+        install_dir,
+        copy_function=link_or_copy if same_volume else fast_copy,
+    )
+
+
+def requirements_hash(req_bytes, extra_packages):
+    """Hash requirements.txt content together with the extra packages installed alongside it"""
+    digest = hashlib.blake2b(req_bytes, digest_size=16)
+    digest.update("\n".join(extra_packages).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def requirements_up_to_date(venv_path, req_hash):
+    """True when the venv was last provisioned from the same requirements"""
+    marker = venv_path / ".req.hash"
+    try:
+        return marker.read_text(encoding="utf-8") == req_hash
+    except OSError:
+        return False
+
+
+def create_shell_link(lnk_path, target, icon=None, arguments="", working_dir=None):
+    """Create a .lnk in-process through the pywin32 IShellLink interface"""
+    import pythoncom
+    from win32com.shell import shell
+
+    link = pythoncom.CoCreateInstance(
+        shell.CLSID_ShellLink, None, pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink
+    )
+    link.SetPath(str(target))
+    link.SetArguments(arguments)
+    link.SetWorkingDirectory(str(working_dir or target.parent))
+    link.SetIconLocation(str(icon if icon else target), 0)
+    link.QueryInterface(pythoncom.IID_IPersistFile).Save(str(lnk_path), 0)
+
+
+def get_desktop_path():
+    """Resolve the (possibly redirected) desktop folder"""
+    try:
+        from win32com.shell import shell, shellcon
+        return Path(shell.SHGetFolderPath(0, shellcon.CSIDL_DESKTOPDIRECTORY, None, 0))
+    except Exception:
+        return Path.home() / "Desktop"
+
+
+def create_desktop_shortcut(target, icon=None, arguments="", working_dir=None):
+    """Create desktop shortcut via IShellLink, using VBScript as fallback"""
+    desktop = get_desktop_path()
+    working_dir = working_dir or target.parent
+    try:
+        create_shell_link(desktop / "Quran Search.lnk", target, icon, arguments, working_dir)
+        logging.info("Created desktop shortcut via IShellLink")
+        return True
+    except Exception as e:
+        logging.warning(f"IShellLink unavailable ({e}), using VBScript fallback")
+
     vbs_script = desktop / "Quran Search.vbs"
     
     script_content = f'''
     Set WshShell = WScript.CreateObject("WScript.Shell")
     Set shortcut = WshShell.CreateShortcut("{desktop / 'Quran Search.lnk'}")
     shortcut.TargetPath = "{target}"
-    shortcut.WorkingDirectory = "{target.parent}"
+    shortcut.Arguments = "{arguments.replace('"', '""')}"
+    shortcut.WorkingDirectory = "{working_dir}"
     shortcut.IconLocation = "{icon if icon else target}"
     shortcut.Save
     '''
     
     try:
-        with open(vbs_script, 'w') as f:
-            f.write(script_content)
-        subprocess.run(['cscript.exe', '//B', str(vbs_script)], check=True)
+        # UTF-16 with BOM lets cscript handle non-ASCII install paths
+        write_file(vbs_script, b"\xff\xfe" + script_content.encode("utf-16-le"))
+        run_command(['cscript.exe', '//B', vbs_script])
         vbs_script.unlink()
         logging.info("Created desktop shortcut via VBScript fallback")
         return True
@@ -81,51 +370,61 @@ def main():
     source_dir = Path(__file__).parent.resolve()
     install_dir = get_install_path()
     venv_path = install_dir / "venv"
+    scripts_dir = venv_path / "Scripts"
+    python_exe = scripts_dir / "python.exe"
+    pythonw_exe = scripts_dir / "pythonw.exe"
 
     try:
         # Create installation directory
         install_dir.mkdir(parents=True, exist_ok=True)
         logging.info(f"Installation directory: {install_dir}")
 
-        # Copy files
-        logging.info("Copying application files...")
-        shutil.copytree(source_dir, install_dir, dirs_exist_ok=True)
-
-        # Create virtual environment
-        if not create_virtualenv(venv_path):
-            logging.error("Virtual environment creation failed")
-            sys.exit(1)
-
-        # Install requirements
         # Install requirements from requirements.txt, winshell, and pywin32
-        req_file = install_dir / "requirements.txt"
-        if not install_packages(venv_path, ["-r", str(req_file), "winshell", "pywin32"]):
-            logging.error("Initial package installation failed. Attempting to install PyQt5 and PyQtWebEngine manually...")
-            if not install_packages(venv_path, ["PyQt5", "PyQtWebEngine", "winshell", "pywin32"]):
-                logging.error("Manual installation of PyQt5, PyQtWebEngine and , winshell, pywin32 also failed.")
+        # requirements.txt is read once; pip gets the specifiers on its command line
+        req_bytes = (source_dir / "requirements.txt").read_bytes()
+        extra_packages = ["winshell", "pywin32"]
+        req_hash = requirements_hash(req_bytes, extra_packages)
+        packages_ready = requirements_up_to_date(venv_path, req_hash)
+        packages = parse_requirements(req_bytes.decode("utf-8")) + extra_packages
+        wheel_dir = get_wheel_cache_path()
+        wheel_dir.mkdir(parents=True, exist_ok=True)
+
+        # Copying files, creating the venv and fetching wheels are independent: overlap them
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            logging.info("Copying application files...")
+            copy_job = executor.submit(copy_application_files, source_dir, install_dir)
+            if not packages_ready:
+                venv_job = executor.submit(create_virtualenv, venv_path)
+                executor.submit(download_packages, packages, wheel_dir)
+            copy_job.result()
+            if not packages_ready and not venv_job.result():
+                logging.error("Virtual environment creation failed")
                 sys.exit(1)
 
-        # Create launcher
-        python_exe = venv_path / "Scripts" / "pythonw.exe"
-        gui_script = install_dir / "gui.py"
+        if packages_ready:
+            logging.info("Requirements unchanged since last install, skipping venv and pip")
+        else:
+            # requirements.txt pins the whole dependency closure, so skip the resolver first
+            if not install_packages(python_exe, ["--no-deps"] + packages, wheel_dir):
+                # One resolver run, held to the Windows pins so retries are deterministic
+                logging.error("Initial package installation failed. Attempting to install PyQt5 and PyQtWebEngine manually...")
+                constraints_file = source_dir / "requirements-w.txt"
+                constraints = ["-c", str(constraints_file)] if constraints_file.exists() else []
+                fallback = ["--upgrade-strategy", "only-if-needed"] + constraints
+                if not install_packages(python_exe, fallback + ["PyQt5", "PyQtWebEngine"] + extra_packages, wheel_dir):
+                    logging.error("Manual installation of PyQt5, PyQtWebEngine and , winshell, pywin32 also failed.")
+                    sys.exit(1)
+            (venv_path / ".req.hash").write_text(req_hash, encoding="utf-8")
+
+        # Create command line launcher
+        app_script = install_dir / "app.py"
+        app_arguments = f'"{app_script}"'
         bat_launcher = install_dir / "quran-search.bat"
         
-        with open(bat_launcher, 'w') as f:
-            f.write(f'@"{python_exe}" "{gui_script}" %*')
+        write_file(bat_launcher, f'@"{pythonw_exe}" {app_arguments} %*'.encode(locale.getpreferredencoding(False)))
 
-        # Create shortcuts
-        try:
-            from winshell import desktop, shortcut
-            shortcut_path = desktop() / "Quran Search.lnk"
-            with shortcut.Shortcut(shortcut_path) as s:
-                s.path = str(bat_launcher)
-                s.working_directory = str(install_dir)
-                s.icon_location = (str(install_dir / "icon.ico"), 0)
-                s.write()
-            logging.info("Created desktop shortcut using winshell")
-        except ImportError:
-            logging.warning("winshell/pywin32 not available, using VBScript fallback")
-            create_desktop_shortcut(bat_launcher, install_dir / "icon.ico")
+        # Create shortcuts pointing straight at pythonw.exe (GUI subsystem, no console)
+        create_desktop_shortcut(pythonw_exe, install_dir / "icon.ico", app_arguments, install_dir)
 
         logging.info("Installation completed successfully")
 
@@ -1,11 +1,50 @@
+import csv
+import hashlib
+import logging
 import sqlite3
+import threading
 from pathlib import Path
-from datetime import datetime
 import json
 
 from PyQt5.QtCore import QStandardPaths
 
 
+def _dump_items(items):
+    """Canonical JSON for course items; stored text and hashes depend on it"""
+    return json.dumps(items, sort_keys=True)
+
+
+def _items_hash(items_json):
+    """Fixed-width digest of a course's items JSON, used for indexed lookups"""
+    return hashlib.blake2b(items_json.encode("utf-8"), digest_size=16).digest()
+
+
+def _migrate_to_without_rowid(conn, table, create_sql, copy_sql):
+    """
+    Create table with create_sql, rebuilding it if an older database still
+    has the rowid version. copy_sql moves the rows over from "<table>_old".
+    """
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    if row is None:
+        conn.execute(create_sql)
+        return
+    if "WITHOUT ROWID" in row[0].upper():
+        return
+    # Keep the rename, copy and drop in one transaction
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    conn.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    conn.execute(create_sql)
+    conn.execute(copy_sql)
+    conn.execute(f"DROP TABLE {table}_old")
+
+
+# Marks the cached active group id as not loaded yet (None means "no active group")
+_UNSET = object()
+
+
 class DbManager:
     def __init__(self):
         # Get the writable location for application data
@@ -13,10 +52,35 @@ class DbManager:
         # Ensure the directory exists
         app_data_path.mkdir(parents=True, exist_ok=True)
         self.db_path = app_data_path / "quran_notes.db"
+        # One long-lived connection keeps SQLite's page cache warm between calls,
+        # and its statement cache lets repeated queries skip re-parsing
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256
+        )
+        self._lock = threading.RLock()
+        self._bookmark_writes = 0
+        self._active_group_id = _UNSET
+        self._configure_connection()
         self._init_db()
 
+    def _configure_connection(self):
+        """Per-connection settings, applied once instead of on every call"""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+
+    def close(self):
+        """Close the shared connection (call on application shutdown)"""
+        with self._lock:
+            # Refresh planner statistics for the indexes used this session
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+
     def _init_db(self):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS notes (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -26,7 +90,10 @@ class DbManager:
                     created TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_surah_ayah ON notes (surah, ayah)")
+            # Covering index: note_exists never touches the table, and its
+            # (surah, ayah) prefix serves every per-verse lookup
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_notes_saq ON notes (surah, ayah, content)")
+            conn.execute("DROP INDEX IF EXISTS idx_surah_ayah")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS courses (
                     id INTEGER PRIMARY KEY,
@@ -36,15 +103,50 @@ class DbManager:
                     modified DATETIME
                 );
             """)
-            conn.execute("""
+            # Hash of items so duplicate checks can use an index instead of
+            # comparing every stored JSON blob
+            cursor = conn.execute("PRAGMA table_info(courses)")
+            if 'items_hash' not in [row[1] for row in cursor.fetchall()]:
+                conn.execute("ALTER TABLE courses ADD COLUMN items_hash BLOB")
+            rows = conn.execute(
+                "SELECT id, items FROM courses WHERE items_hash IS NULL AND items IS NOT NULL"
+            ).fetchall()
+            if rows:
+                conn.executemany(
+                    "UPDATE courses SET items_hash = ? WHERE id = ?",
+                    [(_items_hash(items), course_id) for course_id, items in rows]
+                )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_courses_items_hash ON courses (items_hash)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_courses_title ON courses (title)")
+            # One row per verse, keyed by the verse itself (no separate rowid
+            # B-tree); legacy duplicates collapse to their newest row. seq takes
+            # over the old id's job of ordering bookmarks by recency, since
+            # timestamps only have one-second resolution
+            _migrate_to_without_rowid(conn, "bookmarks", """
                 CREATE TABLE IF NOT EXISTS bookmarks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
                     surah INTEGER NOT NULL,
                     ayah INTEGER NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    seq INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (surah, ayah)
+                ) WITHOUT ROWID
+            """, """
+                INSERT OR REPLACE INTO bookmarks (surah, ayah, timestamp, seq)
+                SELECT surah, ayah, timestamp, id FROM bookmarks_old ORDER BY id
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_bookmarks ON bookmarks (timestamp)")
+            cursor = conn.execute("PRAGMA table_info(bookmarks)")
+            if 'seq' not in [row[1] for row in cursor.fetchall()]:
+                # WITHOUT ROWID table from before seq existed: number rows by age
+                conn.execute("ALTER TABLE bookmarks ADD COLUMN seq INTEGER NOT NULL DEFAULT 0")
+                rows = conn.execute(
+                    "SELECT surah, ayah FROM bookmarks ORDER BY timestamp, surah, ayah"
+                ).fetchall()
+                conn.executemany(
+                    "UPDATE bookmarks SET seq = ? WHERE surah = ? AND ayah = ?",
+                    [(seq, surah, ayah) for seq, (surah, ayah) in enumerate(rows, 1)]
+                )
+            conn.execute("DROP INDEX IF EXISTS idx_bookmarks")
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_bookmarks_seq ON bookmarks (seq)")
 
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS word_dictionary (
@@ -68,29 +170,28 @@ class DbManager:
                 )
             """)
 
-            # Modify pinned_verses table
-            conn.execute("""
+            # Check if position column exists, if not add it
+            cursor = conn.execute("PRAGMA table_info(pinned_verses)")
+            columns = [row[1] for row in cursor.fetchall()]
+            if columns and 'position' not in columns:
+                conn.execute("ALTER TABLE pinned_verses ADD COLUMN position INTEGER DEFAULT 0")
+
+            # Modify pinned_verses table: the primary key enforces uniqueness and
+            # serves per-group lookups, so no rowid or extra unique index
+            _migrate_to_without_rowid(conn, "pinned_verses", """
                 CREATE TABLE IF NOT EXISTS pinned_verses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
                     surah INTEGER NOT NULL,
                     ayah INTEGER NOT NULL,
                     group_id INTEGER NOT NULL,
                     position INTEGER DEFAULT 0,
                     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (group_id, surah, ayah),
                     FOREIGN KEY(group_id) REFERENCES pinned_groups(id) ON DELETE CASCADE
-                )
-            """)
-            
-            # Check if position column exists, if not add it
-            cursor = conn.execute("PRAGMA table_info(pinned_verses)")
-            columns = [row[1] for row in cursor.fetchall()]
-            if 'position' not in columns:
-                conn.execute("ALTER TABLE pinned_verses ADD COLUMN position INTEGER DEFAULT 0")
-                
-            # enforce uniqueness (idempotent)
-            conn.execute("""
-                CREATE UNIQUE INDEX IF NOT EXISTS ux_pinned_verses_surah_ayah_group
-                ON pinned_verses (surah, ayah, group_id)
+                ) WITHOUT ROWID
+            """, """
+                INSERT OR IGNORE INTO pinned_verses (surah, ayah, group_id, position, timestamp)
+                SELECT surah, ayah, group_id, position, timestamp FROM pinned_verses_old
+                WHERE group_id IN (SELECT id FROM pinned_groups)
             """)
             # Create default group if none exists
             conn.execute("""
@@ -99,7 +200,7 @@ class DbManager:
             """)
 
             # Check if any pinned verses exist
-            cursor = conn.execute("SELECT COUNT(*) FROM pinned_verses")
+            cursor = conn.execute("SELECT EXISTS(SELECT 1 FROM pinned_verses)")
             if cursor.fetchone()[0] == 0:
                 # Add default verses only if no verses exist
                 default_group_id = 1
@@ -117,7 +218,7 @@ class DbManager:
                     """, (surah, ayah, default_group_id))            
 
     def get_notes(self, surah, ayah):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT id, content, created
                 FROM notes
@@ -125,11 +226,11 @@ class DbManager:
                 ORDER BY created DESC
             """, (surah, ayah))
             return [{"id": row[0], "content": row[1], "created": row[2]}
-                    for row in cursor.fetchall()]
+                    for row in cursor]
         
     def get_all_notes(self):
         """Get all notes sorted by timestamp"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT id, surah, ayah, content, created 
                 FROM notes 
@@ -141,10 +242,10 @@ class DbManager:
                 'ayah': row[2],
                 'content': row[3],
                 'created': row[4]
-            } for row in cursor.fetchall()]
+            } for row in cursor]
 
     def add_note(self, surah, ayah, content):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 INSERT INTO notes (surah, ayah, content)
                 VALUES (?, ?, ?)
@@ -152,7 +253,7 @@ class DbManager:
             return cursor.lastrowid
 
     def update_note(self, note_id, new_content):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("""
                 UPDATE notes
                 SET content = ?, created = CURRENT_TIMESTAMP
@@ -160,28 +261,26 @@ class DbManager:
             """, (new_content, note_id))
 
     def delete_note(self, note_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("DELETE FROM notes WHERE id = ?", (note_id,))
 
     def delete_all_notes(self, surah, ayah):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("DELETE FROM notes WHERE surah=? AND ayah=?", (surah, ayah))
 
     def export_to_csv(self, file_path):
         """Exports all notes to a CSV file."""
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
-                cursor = conn.execute("""
-                    SELECT surah, ayah, content, created
-                    FROM notes
-                    ORDER BY surah, ayah, created
-                """)
-                notes = cursor.fetchall()
-
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 writer.writerow(['Surah', 'Ayah', 'Content', 'Created'])
-                writer.writerows(notes)
+                with self._lock, self._conn as conn:
+                    # Stream rows from the cursor straight into the writer
+                    writer.writerows(conn.execute("""
+                        SELECT surah, ayah, content, created
+                        FROM notes
+                        ORDER BY surah, ayah, created
+                    """))
             return True
         except Exception as e:
             logging.error(f"Export error: {e}")
@@ -199,24 +298,36 @@ class DbManager:
                 if header != ['Surah', 'Ayah', 'Content', 'Created']:
                     raise ValueError("Invalid CSV header. Expected: Surah, Ayah, Content, Created")
 
-                for row in reader:
-                    if len(row) < 4:
-                        errors += 1
-                        continue
-                    try:
-                        surah = int(row[0])
-                        ayah = int(row[1])
-                        content = row[2].strip()
-                        # created is ignored, using current timestamp
-                    except (ValueError, IndexError) as e:
-                        errors += 1
-                        continue
-
-                    if self.note_exists(surah, ayah, content):
-                        duplicates += 1
-                    else:
-                        self.add_note(surah, ayah, content)
-                        imported += 1
+                new_rows = []
+                with self._lock, self._conn as conn:
+                    # Load every existing note key once; duplicates are then set lookups
+                    existing = set(conn.execute("SELECT surah, ayah, content FROM notes"))
+                    for row in reader:
+                        if len(row) < 4:
+                            errors += 1
+                            continue
+                        try:
+                            surah = int(row[0])
+                            ayah = int(row[1])
+                            content = row[2].strip()
+                            # created is ignored, using current timestamp
+                        except (ValueError, IndexError) as e:
+                            errors += 1
+                            continue
+
+                        key = (surah, ayah, content)
+                        if key in existing:
+                            duplicates += 1
+                        else:
+                            existing.add(key)
+                            new_rows.append(key)
+                            imported += 1
+
+                    # One transaction for the whole file instead of a commit per note
+                    conn.executemany("""
+                        INSERT INTO notes (surah, ayah, content)
+                        VALUES (?, ?, ?)
+                    """, new_rows)
             return (imported, duplicates, errors)
         except Exception as e:
             logging.error(f"Import error: {e}")
@@ -224,50 +335,71 @@ class DbManager:
 
     def note_exists(self, surah, ayah, content):
         """Checks if a note with the same surah, ayah, and content exists."""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
-                SELECT COUNT(*)
-                FROM notes
-                WHERE surah=? AND ayah=? AND content=?
+                SELECT EXISTS(
+                    SELECT 1 FROM notes
+                    WHERE surah=? AND ayah=? AND content=?
+                )
             """, (surah, ayah, content))
-            return cursor.fetchone()[0] > 0
+            return cursor.fetchone()[0] == 1
         
     def has_note(self, surah, ayah):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute(
-                "SELECT COUNT(*) FROM notes WHERE surah=? AND ayah=?",
+                "SELECT EXISTS(SELECT 1 FROM notes WHERE surah=? AND ayah=?)",
                 (surah, ayah)
             )
-            count = cursor.fetchone()[0]
-            return count > 0
+            return cursor.fetchone()[0] == 1
             
+    def get_noted_verses(self, pairs):
+        """Return the set of (surah, ayah) pairs from pairs that have at least one note"""
+        pairs = list(pairs)
+        found = set()
+        with self._lock, self._conn as conn:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(pairs), 400):
+                chunk = pairs[start:start + 400]
+                placeholders = ",".join(["(?, ?)"] * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT DISTINCT surah, ayah FROM notes WHERE (surah, ayah) IN (VALUES {placeholders})",
+                    [value for pair in chunk for value in pair]
+                )
+                found.update(cursor)
+        return found
+
     def save_course(self, course_id, title, items):
         """Save course with new structure"""
-        with sqlite3.connect(str(self.db_path)) as conn:
-            items_json = json.dumps(items, sort_keys=True)  # Add sort_keys=True
+        with self._lock, self._conn as conn:
+            items_json = _dump_items(items)
+            items_hash = _items_hash(items_json)
             if course_id:
                 conn.execute("""
                     UPDATE courses SET 
                         title = ?,
                         items = ?,
+                        items_hash = ?,
                         modified = CURRENT_TIMESTAMP
                     WHERE id = ?
-                """, (title, items_json, course_id))
+                """, (title, items_json, items_hash, course_id))
                 return course_id
             else:
                 cursor = conn.execute("""
-                    INSERT INTO courses (title, items, created, modified)
-                    VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """, (title, items_json))
+                    INSERT INTO courses (title, items, items_hash, created, modified)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                """, (title, items_json, items_hash))
                 return cursor.lastrowid
 
     def get_course(self, course_id):
         """Get course with full structure"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
-                SELECT title, items,created,modified FROM courses WHERE id = ?
+                SELECT title, items, created, modified FROM courses WHERE id = ?
             """, (course_id,))
             row = cursor.fetchone()
+            if row is None:
+                return None
+            # Parsed per call: callers edit the returned items in place
             return {
                 'id': course_id,
                 'title': row[0],
@@ -279,52 +411,66 @@ class DbManager:
     def create_new_course(self, title=None):
         """Create a new empty course with deduplicated title"""
         base_title = "New Course" if not title else title
-        counter = 1
-        new_title = base_title
-        
-        while True:
-            # Check both title and content
-            if not any(c[1] == new_title for c in self.get_all_courses()):
-                break
-            new_title = f"{base_title} ({counter})"
-            counter += 1
-            
-        return self.save_course(None, new_title, [])
+        # Only "base" and "base (N)" can collide, fetch those titles once
+        pattern = base_title.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + " (%)"
+        with self._lock:
+            taken = {row[0] for row in self._conn.execute(
+                "SELECT title FROM courses WHERE title = ? OR title LIKE ? ESCAPE '\\'",
+                (base_title, pattern)
+            )}
+            counter = 1
+            new_title = base_title
+            while new_title in taken:
+                new_title = f"{base_title} ({counter})"
+                counter += 1
+
+            return self.save_course(None, new_title, [])
 
     def delete_course(self, course_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("DELETE FROM courses WHERE id = ?", (course_id,))
 
     def get_new_course(self):
         return None, {"title": "", "items": []}
 
     def has_any_courses(self):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("SELECT EXISTS(SELECT 1 FROM courses)")
             return cursor.fetchone()[0] == 1
         
     def has_previous_course(self, current_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             if current_id is None:
                 return False  # New course can't have previous
             cursor = conn.execute(
-                "SELECT EXISTS(SELECT 1 FROM courses WHERE id < ? ORDER BY id DESC LIMIT 1)",
+                "SELECT EXISTS(SELECT 1 FROM courses WHERE id < ?)",
                 (current_id,)
             )
             return cursor.fetchone()[0] == 1
 
     def has_next_course(self, current_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             if current_id is None:
                 return False  # New course can't have next
             cursor = conn.execute(
-                "SELECT EXISTS(SELECT 1 FROM courses WHERE id > ? ORDER BY id ASC LIMIT 1)",
+                "SELECT EXISTS(SELECT 1 FROM courses WHERE id > ?)",
                 (current_id,)
             )
             return cursor.fetchone()[0] == 1
 
+    def get_adjacent_course_ids(self, current_id):
+        """Return (previous_id, next_id) around current_id in one query; None where there is none"""
+        if current_id is None:
+            return None, None
+        with self._lock, self._conn as conn:
+            cursor = conn.execute("""
+                SELECT (SELECT MAX(id) FROM courses WHERE id < ?),
+                       (SELECT MIN(id) FROM courses WHERE id > ?)
+            """, (current_id, current_id))
+            return cursor.fetchone()
+
     def get_previous_course(self, current_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             if current_id is None:
                 # Return the last (most recent) course
                 cursor = conn.execute("SELECT id, title, items FROM courses ORDER BY id DESC LIMIT 1")
@@ -338,18 +484,19 @@ class DbManager:
         return self.get_new_course()
 
     def course_exists(self, title, items):
-        items_json = json.dumps(items, sort_keys=True)
-        with sqlite3.connect(str(self.db_path)) as conn:
+        items_json = _dump_items(items)
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
-                SELECT COUNT(*) 
-                FROM courses 
-                WHERE title = ? AND items = ?
-            """, (title, items_json))
-            return cursor.fetchone()[0] > 0
+                SELECT EXISTS(
+                    SELECT 1 FROM courses 
+                    WHERE items_hash = ? AND title = ? AND items = ?
+                )
+            """, (_items_hash(items_json), title, items_json))
+            return cursor.fetchone()[0] == 1
 
 
     def get_next_course(self, current_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             if current_id is None:
                 # Return the first (oldest) course
                 cursor = conn.execute("SELECT id, title, items FROM courses ORDER BY id ASC LIMIT 1")
@@ -364,55 +511,77 @@ class DbManager:
 
     def get_all_courses(self):
         """Return list of (id, title, items) for all courses"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT id, title, items FROM courses ORDER BY id DESC
             """)
             return [
                 (row[0], row[1], json.loads(row[2]))
-                for row in cursor.fetchall()
+                for row in cursor
             ]
+
+    def get_all_course_titles(self):
+        """Return list of (id, title) for all courses, without decoding items"""
+        with self._lock, self._conn as conn:
+            cursor = conn.execute("SELECT id, title FROM courses ORDER BY id DESC")
+            return cursor.fetchall()
         
     def add_bookmark(self, surah, ayah):
-        with sqlite3.connect(str(self.db_path)) as conn:
-            # Remove duplicates first
-            conn.execute("DELETE FROM bookmarks WHERE surah=? AND ayah=?", (surah, ayah))
-            conn.execute("INSERT INTO bookmarks (surah, ayah) VALUES (?, ?)", (surah, ayah))
-            # Keep only 2500 most recent
+        with self._lock, self._conn as conn:
+            # Insert, or move an existing bookmark to the top (MAX walks idx_bookmarks_seq)
             conn.execute("""
-                DELETE FROM bookmarks 
-                WHERE id NOT IN (
-                    SELECT id 
-                    FROM bookmarks 
-                    ORDER BY timestamp DESC 
-                    LIMIT 2500
-                )
-            """)
+                INSERT INTO bookmarks (surah, ayah, seq)
+                VALUES (?, ?, (SELECT IFNULL(MAX(seq), 0) + 1 FROM bookmarks))
+                ON CONFLICT(surah, ayah) DO UPDATE
+                SET timestamp = CURRENT_TIMESTAMP, seq = excluded.seq
+            """, (surah, ayah))
+            # Keep only 2500 most recent; trimming on every write is wasted work,
+            # so run it on every 100th bookmark of the session
+            self._bookmark_writes += 1
+            if self._bookmark_writes % 100 == 0:
+                # Cut below the 2500th newest seq (walked on idx_bookmarks_seq, no sort);
+                # seq is unique so exactly 2500 rows remain, and with fewer rows
+                # the subquery is NULL and nothing is deleted
+                conn.execute("""
+                    DELETE FROM bookmarks 
+                    WHERE seq < (
+                        SELECT seq 
+                        FROM bookmarks 
+                        ORDER BY seq DESC 
+                        LIMIT 1 OFFSET 2499
+                    )
+                """)
 
     def get_all_bookmarks(self, search_engine):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT surah, ayah, timestamp 
                 FROM bookmarks 
-                ORDER BY timestamp DESC
+                ORDER BY seq DESC
             """)
-            return [{
-                'surah': row[0],
-                'ayah': row[1],
-                'timestamp': row[2],
-                'surah_name': search_engine.get_chapter_name(row[0])
-            } for row in cursor.fetchall()]
+            rows = cursor.fetchall()
+        # Resolve each distinct surah once instead of once per bookmark
+        names = {surah: search_engine.get_chapter_name(surah) for surah in {row[0] for row in rows}}
+        return [{
+            'surah': row[0],
+            'ayah': row[1],
+            'timestamp': row[2],
+            'surah_name': names[row[0]]
+        } for row in rows]
 
     def delete_bookmark(self, surah, ayah):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("DELETE FROM bookmarks WHERE surah=? AND ayah=?", (surah, ayah))
 
     def items_exist(self, items):
         """Check if course items already exist in any course (regardless of title)"""
-        items_json = json.dumps(items, sort_keys=True, ensure_ascii=False)
-        with sqlite3.connect(str(self.db_path)) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM courses WHERE items = ?", (items_json,))
-            return cursor.fetchone()[0] > 0
+        items_json = _dump_items(items)
+        with self._lock, self._conn as conn:
+            cursor = conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM courses WHERE items_hash = ? AND items = ?)",
+                (_items_hash(items_json), items_json)
+            )
+            return cursor.fetchone()[0] == 1
 
     
     # Pinned verses ----------------------------------------------------
@@ -422,12 +591,12 @@ class DbManager:
             group_id = self.get_active_group_id()
             if group_id is None:
                 return False
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute(
-                "SELECT COUNT(*) FROM pinned_verses WHERE surah=? AND ayah=? AND group_id=?",
+                "SELECT EXISTS(SELECT 1 FROM pinned_verses WHERE surah=? AND ayah=? AND group_id=?)",
                 (surah, ayah, group_id)
             )
-            return cursor.fetchone()[0] > 0
+            return cursor.fetchone()[0] == 1
 
     def add_pinned_verse(self, surah, ayah, group_id=None):
         """
@@ -439,17 +608,15 @@ class DbManager:
             if group_id is None:
                 return False
 
-        with sqlite3.connect(str(self.db_path)) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
+        with self._lock, self._conn as conn:
             try:
                 # Use INSERT OR IGNORE to be idempotent; unique index enforces uniqueness.
                 conn.execute(
                     "INSERT OR IGNORE INTO pinned_verses (surah, ayah, group_id) VALUES (?, ?, ?)",
                     (surah, ayah, group_id)
                 )
-                conn.commit()
-                # Return True if row exists now
-                return self.is_pinned(surah, ayah, group_id)
+                # The unique index guarantees the row exists now, no need to re-check
+                return True
             except sqlite3.Error as e:
                 print(f"Error adding pinned verse: {e}")
                 return False
@@ -463,8 +630,7 @@ class DbManager:
             group_id = self.get_active_group_id()
             if group_id is None:
                 return False
-        with sqlite3.connect(str(self.db_path)) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
+        with self._lock, self._conn as conn:
             try:
                 conn.execute(
                     "DELETE FROM pinned_verses WHERE surah=? AND ayah=? AND group_id=?",
@@ -478,8 +644,7 @@ class DbManager:
     
     # Add to DbManager class
     def create_pinned_group(self, name):
-        with sqlite3.connect(str(self.db_path)) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
+        with self._lock, self._conn as conn:
             try:
                 cursor = conn.execute(
                     "INSERT INTO pinned_groups (name) VALUES (?)",
@@ -490,16 +655,17 @@ class DbManager:
                 return None
 
     def delete_pinned_group(self, group_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
+        with self._lock, self._conn as conn:
             conn.execute(
                 "DELETE FROM pinned_groups WHERE id = ?",
                 (group_id,)
             )
+            if group_id == self._active_group_id:
+                self._active_group_id = None
             
     def rename_pinned_group(self, group_id, new_name):
         """Rename a pinned group"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             try:
                 conn.execute(
                     "UPDATE pinned_groups SET name = ? WHERE id = ?",
@@ -511,7 +677,7 @@ class DbManager:
                 return False
 
     def get_pinned_groups(self):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute(
                 "SELECT id, name, active FROM pinned_groups ORDER BY created DESC"
             )
@@ -522,24 +688,28 @@ class DbManager:
             } for row in cursor]
 
     def set_active_group(self, group_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
-            # Deactivate all groups
-            conn.execute("UPDATE pinned_groups SET active = 0")
-            # Activate selected group
-            conn.execute(
-                "UPDATE pinned_groups SET active = 1 WHERE id = ?",
-                (group_id,)
-            )
+        with self._lock, self._conn as conn:
+            # Activate the selected group and deactivate the rest, writing only
+            # rows whose flag actually changes
+            conn.execute("""
+                UPDATE pinned_groups SET active = (id = ?)
+                WHERE active IS NOT (id = ?)
+            """, (group_id, group_id))
+            # Reload on next use so an unknown id still resolves to None
+            self._active_group_id = _UNSET
 
     def get_active_group_id(self):
-        """Return active group id or None"""
-        with sqlite3.connect(str(self.db_path)) as conn:
-            cursor = conn.execute("SELECT id FROM pinned_groups WHERE active = 1 LIMIT 1")
-            row = cursor.fetchone()
-            return row[0] if row else None
+        """Return active group id or None (cached until the active group changes)"""
+        with self._lock:
+            if self._active_group_id is _UNSET:
+                row = self._conn.execute(
+                    "SELECT id FROM pinned_groups WHERE active = 1 LIMIT 1"
+                ).fetchone()
+                self._active_group_id = row[0] if row else None
+            return self._active_group_id
 
     def get_active_pinned_verses(self):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT pv.surah, pv.ayah, pv.timestamp
                 FROM pinned_verses pv
@@ -555,7 +725,7 @@ class DbManager:
 
     # Add to DbManager
     def get_pinned_verses_by_group(self, group_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT surah, ayah, timestamp 
                 FROM pinned_verses 
@@ -570,25 +740,24 @@ class DbManager:
 
     def get_all_pinned_verses(self):
         """Get all pinned verses with group information"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
-                SELECT pv.id, pv.surah, pv.ayah, pv.group_id, pv.timestamp,
+                SELECT pv.surah, pv.ayah, pv.group_id, pv.timestamp,
                     pg.name as group_name
                 FROM pinned_verses pv
                 JOIN pinned_groups pg ON pv.group_id = pg.id
             """)
             return [{
-                'id': row[0],
-                'surah': row[1],
-                'ayah': row[2],
-                'group_id': row[3],
-                'timestamp': row[4],
-                'group_name': row[5]
-            } for row in cursor.fetchall()]
+                'surah': row[0],
+                'ayah': row[1],
+                'group_id': row[2],
+                'timestamp': row[3],
+                'group_name': row[4]
+            } for row in cursor]
 
 
     def update_pinned_verse_position(self, surah, ayah, group_id, position):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("""
                 UPDATE pinned_verses 
                 SET position = ? 
@@ -596,7 +765,7 @@ class DbManager:
             """, (position, surah, ayah, group_id))
 
     def get_pinned_verses_by_group_ordered(self, group_id):
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT surah, ayah, timestamp, position 
                 FROM pinned_verses 
@@ -608,11 +777,11 @@ class DbManager:
                 'ayah': row[1],
                 'timestamp': row[2],
                 'position': row[3]
-            } for row in cursor.fetchall()]
+            } for row in cursor]
 
     def reorder_pinned_verses(self, group_id, new_order):
         """Update positions for all verses in a group based on new order"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             for position, (surah, ayah) in enumerate(new_order):
                 conn.execute("""
                     UPDATE pinned_verses 
@@ -622,7 +791,7 @@ class DbManager:
 
     def get_active_pinned_verses_ordered(self):
         """Return active pinned verses ordered by position"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT pv.surah, pv.ayah, pv.timestamp, pv.position
                 FROM pinned_verses pv
@@ -635,13 +804,13 @@ class DbManager:
                 'ayah': row[1],
                 'timestamp': row[2],
                 'position': row[3]
-            } for row in cursor.fetchall()]
+            } for row in cursor]
 
 
     # Word dictionary methods
     def add_word(self, word, definition):
         """Add a new word with definition"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             try:
                 cursor = conn.execute("""
                     INSERT INTO word_dictionary (word, definition)
@@ -653,7 +822,7 @@ class DbManager:
     
     def update_word(self, word_id, definition):
         """Update word definition"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("""
                 UPDATE word_dictionary 
                 SET definition = ?, modified = CURRENT_TIMESTAMP
@@ -662,12 +831,12 @@ class DbManager:
     
     def delete_word(self, word_id):
         """Delete a word from dictionary"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("DELETE FROM word_dictionary WHERE id = ?", (word_id,))
     
     def get_word(self, word_id):
         """Get a specific word by ID"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT id, word, definition, created, modified
                 FROM word_dictionary
@@ -686,7 +855,7 @@ class DbManager:
     
     def get_word_by_name(self, word):
         """Get a word by its exact name"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT id, word, definition, created, modified
                 FROM word_dictionary
@@ -706,7 +875,7 @@ class DbManager:
     def get_all_words(self, page=1, page_size=50, search_term=""):
         """Get all words with pagination and search"""
         offset = (page - 1) * page_size
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             if search_term:
                 cursor = conn.execute("""
                     SELECT id, word, definition, created, modified
@@ -736,7 +905,7 @@ class DbManager:
     
     def get_total_word_count(self, search_term=""):
         """Get total count of words for pagination"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             if search_term:
                 cursor = conn.execute("""
                     SELECT COUNT(*) 
@@ -750,7 +919,7 @@ class DbManager:
     def get_words_starting_with(self, letter, page=1, page_size=50):
         """Get words starting with a specific letter"""
         offset = (page - 1) * page_size
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT id, word, definition, created, modified
                 FROM word_dictionary
@@ -772,7 +941,7 @@ class DbManager:
     
     def get_total_words_starting_with(self, letter):
         """Get count of words starting with specific letter"""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT COUNT(*) 
                 FROM word_dictionary
@@ -785,7 +954,6 @@ class DbManager:
         imported = 0
         errors = 0
         try:
-            import csv
             with open(file_path, 'r', encoding='utf-8') as f:
                 reader = csv.reader(f)
                 next(reader, None)  # Skip header
@@ -821,8 +989,7 @@ class DbManager:
     def export_words_to_csv(self, file_path):
         """Export words to CSV file"""
         try:
-            import csv
-            with sqlite3.connect(str(self.db_path)) as conn:
+            with self._lock, self._conn as conn:
                 cursor = conn.execute("""
                     SELECT word, definition
                     FROM word_dictionary
@@ -832,7 +999,7 @@ class DbManager:
                 with open(file_path, 'w', newline='', encoding='utf-8') as f:
                     writer = csv.writer(f)
                     writer.writerow(['Word', 'Definition'])
-                    writer.writerows(cursor.fetchall())
+                    writer.writerows(cursor)
                 
                 return True
         except Exception as e:
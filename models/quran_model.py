@@ -2,7 +2,6 @@ from PyQt5 import QtCore
 
 class QuranListModel(QtCore.QAbstractListModel):
     loading_started = QtCore.pyqtSignal(int)  # Total results count
-    loading_progress = QtCore.pyqtSignal(int, int, int)  # Loaded, Total, Remaining
     loading_complete = QtCore.pyqtSignal(int)  # Final count
     def __init__(self, results=None, parent=None):
         super().__init__(parent)
@@ -15,15 +14,16 @@ class QuranListModel(QtCore.QAbstractListModel):
         pass
 
     def data(self, index, role=QtCore.Qt.DisplayRole):
-        if not index.isValid() or index.row() >= len(self.results):
+        # Views never ask past rowCount(), which is _displayed_results
+        row = index.row()
+        if not index.isValid() or row >= self._displayed_results:
             return None
 
-        result = self.results[index.row()]
-
-        if role == QtCore.Qt.DisplayRole:
-            return result.get('text_uthmani', '')
-        elif role == QtCore.Qt.UserRole:
-            return result
+        # UserRole first: the delegate asks for it on every paint and size hint
+        if role == QtCore.Qt.UserRole:
+            return self.results[row]
+        elif role == QtCore.Qt.DisplayRole:
+            return self.results[row].get('text_uthmani', '')
         return None
 
     def rowCount(self, parent=QtCore.QModelIndex()):
@@ -40,39 +40,20 @@ class QuranListModel(QtCore.QAbstractListModel):
     def updateResults(self, results):
         self.beginResetModel()
         self.results = results
-        self._displayed_results = min(50, len(results))  # Initial batch
+        # Expose every row at once; the view lays them out in batches itself
+        self._displayed_results = len(results)
         self.endResetModel()
-        # Schedule remaining results
         if len(results) > 50:
             self.loading_started.emit(len(results))  # Emit total count
-            QtCore.QTimer.singleShot(50, lambda: self.load_remaining_results())
-
-    def load_remaining_results(self):
-        remaining = len(self.results) - self._displayed_results
-        if remaining > 0:
-            batch_size = min(150, remaining)
-            self.beginInsertRows(QtCore.QModelIndex(),
-                               self._displayed_results,
-                               self._displayed_results + batch_size - 1)
-            self._displayed_results += batch_size
-            self.endInsertRows()
-            
-            # Emit progress: loaded, total, remaining
-            self.loading_progress.emit(
-                self._displayed_results,
-                len(self.results),
-                len(self.results) - self._displayed_results
-            )
-            
-            QtCore.QTimer.singleShot(50, self.load_remaining_results)
-        else:
-            self.loading_complete.emit(len(self.results))
+            # Deferred so slots connected right after updateResults still fire
+            QtCore.QTimer.singleShot(0, lambda: self.loading_complete.emit(len(self.results)))
 
 
 class BookmarkModel(QtCore.QAbstractListModel):
     def __init__(self):
         super().__init__()
         self._bookmarks = []
+        self._display_html = []  # Rendered once per load, parallel to _bookmarks
         self._loaded_count = 0
         self.chunk_size = 100  # Items per chunk
         self.load_timer = QtCore.QTimer()
@@ -85,10 +66,15 @@ class BookmarkModel(QtCore.QAbstractListModel):
         if not index.isValid() or index.row() >= len(self._bookmarks):
             return None
             
-        bm = self._bookmarks[index.row()]
-        
         if role == QtCore.Qt.DisplayRole:
-            return f"""
+            return self._display_html[index.row()]
+        if role == QtCore.Qt.UserRole:
+            return self._bookmarks[index.row()]
+        return None
+
+    @staticmethod
+    def _format_bookmark(bm):
+        return f"""
                 <div style='font-family: Amiri; font-size: 14pt'>
                     <b>{bm['surah_name']} - الآية {bm['ayah']}</b><br>
                     <span style='color: #666; font-size: 12pt'>
@@ -96,13 +82,11 @@ class BookmarkModel(QtCore.QAbstractListModel):
                     </span>
                 </div>
             """
-        if role == QtCore.Qt.UserRole:
-            return bm
-        return None
 
     def load_bookmarks(self, bookmarks):
         self.beginResetModel()
         self._bookmarks = bookmarks
+        self._display_html = [self._format_bookmark(bm) for bm in bookmarks]
         self._loaded_count = min(self._loaded_count, len(self._bookmarks))
         self.endResetModel()
         self.load_timer.start(0)  # Start loading immediately
@@ -121,3 +105,11 @@ class BookmarkModel(QtCore.QAbstractListModel):
                            self._loaded_count + chunk - 1)
         self._loaded_count += chunk
         self.endInsertRows()
+
+    def remove_bookmark(self, row):
+        """Remove a single row, keeping the rendered HTML in step"""
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._bookmarks[row]
+        del self._display_html[row]
+        self._loaded_count = min(self._loaded_count, len(self._bookmarks))
+        self.endRemoveRows()
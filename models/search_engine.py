@@ -1,9 +1,16 @@
 ### ./models/search_engine.py ###
 import re
 import os, sys
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
+import hashlib
 import importlib.resources
 import logging
 import unicodedata
+from pathlib import Path
+
+from PyQt5.QtCore import QStandardPaths
 
 
 def resource_path(relative_path):
@@ -25,12 +32,69 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# Parsed form of a search query; immutable because parses are memoized and shared
+_ParsedQuery = namedtuple('_ParsedQuery', 'term pattern_type preserve_hamza normalized_query')
+
+# Bump whenever the normalization rules or tables change, so on-disk
+# normalized corpus caches written by older versions are rebuilt
+_NORMALIZATION_VERSION = 1
+
+# Dagger alif (optionally after a tatweel) directly before 'ن'
+_DAGGER_RE = re.compile(r'ـ?ٰ(?=ن)')
+
+# Alif variants and related letters, applied in a single translate() pass
+_HAMZA_TABLE = str.maketrans({
+    'إ': 'ا',
+    'أ': 'ا',
+    'آ': 'ا',
+    'ٱ': 'ا',  # Alif Wasla
+    'ـ': '',   # Tatweel
+    #'ء': '',   # Standalone hamza removed
+    'ئ': 'ي',
+    'ؤ': 'و',
+    'ى': 'ي',
+    'ة': 'ه',
+})
+
+
+class _DiacriticsTable(dict):
+    """
+    translate() table mapping a code point to its NFKD form with all marks
+    dropped, filled in the first time each character is seen. NFKD never
+    reorders anything but marks, so this matches decomposing the whole string.
+    """
+    def __missing__(self, codepoint):
+        decomposed = unicodedata.normalize('NFKD', chr(codepoint))
+        value = ''.join(ch for ch in decomposed if not unicodedata.category(ch).startswith('M'))
+        self[codepoint] = value
+        return value
+
+
+_DIACRITICS_TABLE = _DiacriticsTable()
+
+
+class _PhraseCharTable(dict):
+    """
+    Per code point result of stripping diacritics and folding hamza, as used
+    by highlight_phrase to keep a mapping back to the original characters.
+    """
+    def __missing__(self, codepoint):
+        value = chr(codepoint).translate(_DIACRITICS_TABLE).translate(_HAMZA_TABLE)
+        self[codepoint] = value
+        return value
+
+
+_PHRASE_CHAR_TABLE = _PhraseCharTable()
+
+
 class QuranSearch:
     def __init__(self):
         self._chapters = []
         self._uthmani = {}
         self._simplified = {}
         self._verse_counts = {}  # {surah: total_verses}
+        self._normalized_simplified = {}  # {preserve_hamza: {(surah, ayah): text}}
+        self._word_indexes = {}  # {preserve_hamza: (postings, sorted_words, sorted_reversed_words, verse_word_counts)}
         self._load_data()
         self.highlight_color = "#FFD700"  # Gold color for highlighting
 
@@ -40,6 +104,8 @@ class QuranSearch:
         self._load_chapters()
         self._load_verses('quran_text/uthmani.txt', self._uthmani)
         self._load_verses('quran_text/simplified.txt', self._simplified)
+        self._verse_keys = list(self._simplified)  # verse number -> (surah, ayah)
+        self._verse_numbers = {key: verse_no for verse_no, key in enumerate(self._verse_keys)}
         self._build_verse_counts()
 
     def _load_chapters(self):
@@ -82,24 +148,113 @@ class QuranSearch:
             counts[surah] = max(counts.get(surah, 0), ayah)
         self._verse_counts = counts
 
+    def _get_normalized_verses(self, preserve_hamza=False):
+        """Normalized simplified text per verse, built on first use and shared by all searches"""
+        normalized = self._normalized_simplified.get(preserve_hamza)
+        if normalized is None:
+            cache_file = "quran_normalized_hamza.cache" if preserve_hamza else "quran_normalized.cache"
+            source = '\n'.join(data['text'] for data in self._simplified.values())
+            # Tied to the exact source text and normalization rules, never to file dates
+            cache_key = "v{} {}".format(
+                _NORMALIZATION_VERSION,
+                hashlib.blake2b(source.encode('utf-8'), digest_size=16).hexdigest())
+            texts = self._load_normalized_cache(cache_file, cache_key)
+            if texts is None:
+                # Normalize the whole corpus in one pass (every step is per character,
+                # and verses never contain newlines), bypassing the LRU cache
+                texts = self._normalize_text.__wrapped__(source, preserve_hamza).split('\n')
+                texts = [text.strip() for text in texts]
+                self._save_normalized_cache(cache_file, cache_key, texts)
+            normalized = dict(zip(self._simplified, texts))
+            self._normalized_simplified[preserve_hamza] = normalized
+        return normalized
+
+    @staticmethod
+    def _normalized_cache_dir():
+        """User-writable directory for the normalized corpus caches"""
+        return Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
+
+    def _load_normalized_cache(self, cache_file, cache_key):
+        """
+        Read normalized verses saved by a previous run (or bundled with a
+        release build) if the file's key line matches cache_key, else None
+        """
+        for cache_path in (self._normalized_cache_dir() / cache_file,
+                           Path(resource_path(f"../models/{cache_file}"))):
+            try:
+                if not cache_path.exists():
+                    continue
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    key, _, body = f.read().partition('\n')
+                texts = body.split('\n')
+                if key == cache_key and len(texts) == len(self._simplified):
+                    return texts
+            except Exception as e:
+                logging.error(f"Normalized cache error: {str(e)}")
+        return None
+
+    def _save_normalized_cache(self, cache_file, cache_key, texts):
+        """Persist normalized verses so later startups can skip normalization"""
+        try:
+            cache_dir = self._normalized_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_dir / cache_file, 'w', encoding='utf-8') as f:
+                f.write(cache_key + '\n' + '\n'.join(texts))
+        except Exception as e:
+            logging.error(f"Normalized cache write failed: {str(e)}")
+
+    def _get_word_index(self, preserve_hamza=False):
+        """
+        Inverted index over normalized words, built on first use:
+        postings maps word -> [(verse_no, count), ...] in corpus order, the
+        sorted word lists (plain and reversed) serve prefix and suffix lookups,
+        and verse_word_counts[verse_no] is that verse's {word: count}.
+        """
+        index = self._word_indexes.get(preserve_hamza)
+        if index is None:
+            postings = {}
+            verse_word_counts = []
+            for verse_no, text in enumerate(self._get_normalized_verses(preserve_hamza).values()):
+                counts = {}
+                for word in text.split():
+                    counts[word] = counts.get(word, 0) + 1
+                for word, count in counts.items():
+                    postings.setdefault(word, []).append((verse_no, count))
+                verse_word_counts.append(counts)
+            index = (postings, sorted(postings), sorted(word[::-1] for word in postings), verse_word_counts)
+            self._word_indexes[preserve_hamza] = index
+        return index
+
+    @staticmethod
+    def _words_with_prefix(sorted_words, prefix):
+        """All entries of a sorted word list that start with prefix"""
+        matches = []
+        for i in range(bisect_left(sorted_words, prefix), len(sorted_words)):
+            if not sorted_words[i].startswith(prefix):
+                break
+            matches.append(sorted_words[i])
+        return matches
+
+    def _find_word_matches(self, normalized_query, pattern_type, preserve_hamza=False):
+        """Return {verse_no: occurrences} for exact_word/starts_with/ends_with searches"""
+        postings, sorted_words, sorted_reversed, _ = self._get_word_index(preserve_hamza)
+        if pattern_type == 'exact_word':
+            words = [normalized_query] if normalized_query in postings else []
+        elif pattern_type == 'starts_with':
+            words = self._words_with_prefix(sorted_words, normalized_query)
+        else:
+            words = [w[::-1] for w in self._words_with_prefix(sorted_reversed, normalized_query[::-1])]
+
+        matches = {}
+        for word in words:
+            for verse_no, count in postings[word]:
+                matches[verse_no] = matches.get(verse_no, 0) + count
+        return matches
+
     @staticmethod
     def _normalize_hamza(text):
         """Normalize all alif variants to standard ا"""
-        replacements = {
-            'إ': 'ا',
-            'أ': 'ا',
-            'آ': 'ا',
-            'ٱ': 'ا',  # Alif Wasla
-            'ـ': '',   # Tatweel
-            #'ء': '',   # Standalone hamza removed
-            'ئ': 'ي',
-            'ؤ': 'و',
-            'ى': 'ي',
-            'ة': 'ه',
-        }
-        for orig, repl in replacements.items():
-            text = text.replace(orig, repl)
-        return text
+        return text.translate(_HAMZA_TABLE)
 
     @staticmethod
     def replace_dagger_alif(text):
@@ -108,8 +263,10 @@ class QuranSearch:
         (as in 'ٱلرَّحْمَـٰنِ' should become 'الرحمن'),
         and in other contexts replace it with a regular 'ا'.
         """
+        if 'ٰ' not in text:
+            return text
         # Remove dagger alif when followed by ن (lookahead)
-        text = re.sub(r'ـ?ٰ(?=ن)', '', text)
+        text = _DAGGER_RE.sub('', text)
         # Replace remaining dagger alif with a regular alif
         text = text.replace('ٰ', 'ا')
         return text
@@ -117,12 +274,12 @@ class QuranSearch:
     @staticmethod
     def _remove_diacritics(text):
         """Remove all Arabic diacritics including extended ranges"""
-        decomposed = unicodedata.normalize('NFKD', text)
-        filtered = ''.join(ch for ch in decomposed if not unicodedata.category(ch).startswith('M'))
-        return filtered
+        return text.translate(_DIACRITICS_TABLE)
     
-    @staticmethod   
+    @staticmethod
+    @lru_cache(maxsize=16384)
     def _normalize_text(text="", preserve_hamza=False):
+        # Memoized: queries and per-word highlight lookups repeat the same strings
         if not preserve_hamza:
             # Replace dagger alif with a regular alif before diacritics are removed.
             text = QuranSearch.replace_dagger_alif(text)
@@ -134,13 +291,29 @@ class QuranSearch:
         text = unicodedata.normalize('NFC', text)
         return text.strip()
 
-    def _parse_search_query(self, query):
-        """Parse search query for special operators and patterns"""
-        # Check for surah tokens
-        in_current_surah = '!' in query
-        in_combo_surah = '?' in query or '؟' in query
-        
-        # Remove surah tokens from the query for parsing
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _tokenize_words(text, preserve_hamza=False):
+        """
+        Split text into (original_word, normalized_word) pairs for the word
+        highlighters. All words are normalized in one batch, and results are
+        memoized since the same verses are highlighted again and again.
+        """
+        words = text.split()
+        normalized = QuranSearch._normalize_text.__wrapped__('\n'.join(words), preserve_hamza).split('\n')
+        if len(normalized) != len(words):
+            # Leading/trailing words that normalize to nothing (e.g. pause marks) were stripped
+            normalized = [QuranSearch._normalize_text(word, preserve_hamza) for word in words]
+        return tuple(zip(words, (word.strip() for word in normalized)))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_search_query(query):
+        """
+        Parse search query for special operators and patterns.
+        Returns a _ParsedQuery (term, pattern_type, preserve_hamza, normalized_query).
+        """
+        # Remove surah tokens ('!', '?'), which the main window handles itself
         query = query.replace('!', '').replace('?', '').replace('؟', '')
         
         preserve_hamza = '@' in query
@@ -172,15 +345,10 @@ class QuranSearch:
                 pattern_type = 'substring'
                 term = query
 
-        return {
-            'term': term,
-            'pattern_type': pattern_type,
-            'preserve_hamza': preserve_hamza,
-            'in_current_surah': in_current_surah,
-            'in_combo_surah': in_combo_surah
-        }
+        return _ParsedQuery(term, pattern_type, preserve_hamza,
+                            QuranSearch._normalize_text(term, preserve_hamza))
 
-    def search_in_surah(self, query, surah, is_dark_theme=False, highlight_words=[]):
+    def search_in_surah(self, query, surah, is_dark_theme=False, highlight_words=[], highlight=True):
         """
         Search within a specific surah only.
         
@@ -189,16 +357,15 @@ class QuranSearch:
             surah: Surah number to search within
             is_dark_theme: Theme for highlighting
             highlight_words: Permanent highlight words
+            highlight: When False, return plain verse text without highlight HTML
             
         Returns: (results, total_occurrences)
         """
         # Parse the search query
-        search_params = self._parse_search_query(query)
-        term = search_params['term']
-        pattern_type = search_params['pattern_type']
-        preserve_hamza = search_params['preserve_hamza']
-        
-        normalized_query = self._normalize_text(term, preserve_hamza)
+        term, pattern_type, preserve_hamza, normalized_query = self._parse_search_query(query)
+        normalized_verses = self._get_normalized_verses(preserve_hamza)
+        if pattern_type != 'substring':
+            verse_word_counts = self._get_word_index(preserve_hamza)[3]
         results = []
         total_occurrences = 0
         
@@ -208,37 +375,23 @@ class QuranSearch:
             if not data:
                 continue
                 
-            normalized_text = self._normalize_text(data['text'], preserve_hamza)
-            
             # Apply the appropriate search pattern
-            match_found = False
             occurrences = 0
             
             if pattern_type == 'substring':
-                if normalized_query in normalized_text:
-                    match_found = True
-                    occurrences = normalized_text.count(normalized_query)
-            elif pattern_type == 'starts_with':
-                # Split into words and check each word
-                words = normalized_text.split()
-                for word in words:
-                    if word.startswith(normalized_query):
-                        match_found = True
-                        occurrences += 1
-            elif pattern_type == 'ends_with':
-                # Split into words and check each word
-                words = normalized_text.split()
-                for word in words:
-                    if word.endswith(normalized_query):
-                        match_found = True
-                        occurrences += 1
-            elif pattern_type == 'exact_word':
-                # Split into words and check each word
-                words = normalized_text.split()
-                for word in words:
-                    if word == normalized_query:
-                        match_found = True
-                        occurrences += 1
+                occurrences = normalized_verses[(surah, ayah)].count(normalized_query)
+            else:
+                # Word patterns check the verse's distinct words and their counts
+                word_counts = verse_word_counts[self._verse_numbers[(surah, ayah)]]
+                if pattern_type == 'starts_with':
+                    occurrences = sum(count for word, count in word_counts.items()
+                                      if word.startswith(normalized_query))
+                elif pattern_type == 'ends_with':
+                    occurrences = sum(count for word, count in word_counts.items()
+                                      if word.endswith(normalized_query))
+                elif pattern_type == 'exact_word':
+                    occurrences = word_counts.get(normalized_query, 0)
+            match_found = occurrences > 0
             
             if match_found:
                 total_occurrences += occurrences
@@ -246,8 +399,11 @@ class QuranSearch:
                 uthmani_text = self._uthmani.get((surah, ayah), {}).get('text', '')
                 
                 # Apply search highlighting
-                highlighted_simplified = self.highlight(data['text'], query, is_dark_theme)
-                highlighted_uthmani = self.highlight(uthmani_text, query, is_dark_theme)
+                if highlight:
+                    highlighted_simplified = self.highlight(data['text'], query, is_dark_theme)
+                    highlighted_uthmani = self.highlight(uthmani_text, query, is_dark_theme)
+                else:
+                    highlighted_simplified, highlighted_uthmani = data['text'], uthmani_text
 
                 results.append({
                     'surah': surah,
@@ -259,67 +415,51 @@ class QuranSearch:
         
         return results, total_occurrences
 
-    def search_verses(self, query, is_dark_theme=False, highlight_words=[]):
+    def search_verses(self, query, is_dark_theme=False, highlight_words=[], highlight=True):
+        """
+        Search the whole Quran. Pass highlight=False when the caller only needs
+        plain text, to skip building highlight HTML for every match.
+        """
         # Parse the search query
-        search_params = self._parse_search_query(query)
-        term = search_params['term']
-        pattern_type = search_params['pattern_type']
-        preserve_hamza = search_params['preserve_hamza']
-        
-        normalized_query = self._normalize_text(term, preserve_hamza)
+        term, pattern_type, preserve_hamza, normalized_query = self._parse_search_query(query)
         results = []
         total_occurrences = 0
 
-        for (surah, ayah), data in self._simplified.items():
-            normalized_text = self._normalize_text(data['text'], preserve_hamza)
-            
-            # Apply the appropriate search pattern
-            match_found = False
-            occurrences = 0
-            
-            if pattern_type == 'substring':
-                if normalized_query in normalized_text:
-                    match_found = True
-                    occurrences = normalized_text.count(normalized_query)
-            elif pattern_type == 'starts_with':
-                # Split into words and check each word
-                words = normalized_text.split()
-                for word in words:
-                    if word.startswith(normalized_query):
-                        match_found = True
-                        occurrences += 1
-            elif pattern_type == 'ends_with':
-                # Split into words and check each word
-                words = normalized_text.split()
-                for word in words:
-                    if word.endswith(normalized_query):
-                        match_found = True
-                        occurrences += 1
-            elif pattern_type == 'exact_word':
-                # Split into words and check each word
-                words = normalized_text.split()
-                for word in words:
-                    if word == normalized_query:
-                        match_found = True
-                        occurrences += 1
-            
-            if match_found:
-                total_occurrences += occurrences
+        if pattern_type == 'substring':
+            matches = {}
+            for verse_no, normalized_text in enumerate(self._get_normalized_verses(preserve_hamza).values()):
+                occurrences = normalized_text.count(normalized_query)
+                if occurrences:
+                    matches[verse_no] = occurrences
+        elif pattern_type in ('starts_with', 'ends_with', 'exact_word'):
+            # Word patterns are answered from the inverted index
+            matches = self._find_word_matches(normalized_query, pattern_type, preserve_hamza)
+        else:
+            matches = {}
 
-                uthmani_text = self._uthmani.get((surah, ayah), {}).get('text', '')
-                
-                # Apply search highlighting
+        for verse_no in sorted(matches):
+            surah, ayah = self._verse_keys[verse_no]
+            data = self._simplified[(surah, ayah)]
+            occurrences = matches[verse_no]
+            total_occurrences += occurrences
+
+            uthmani_text = self._uthmani.get((surah, ayah), {}).get('text', '')
+            
+            # Apply search highlighting
+            if highlight:
                 highlighted_simplified = self.highlight(data['text'], query, is_dark_theme)
                 highlighted_uthmani = self.highlight(uthmani_text, query, is_dark_theme)
+            else:
+                highlighted_simplified, highlighted_uthmani = data['text'], uthmani_text
+
+            results.append({
+                'surah': surah,
+                'ayah': ayah,
+                'text_simplified': highlighted_simplified,
+                'text_uthmani': highlighted_uthmani,
+                'chapter': self.get_chapter_name(surah)
+            })
 
-                results.append({
-                    'surah': surah,
-                    'ayah': ayah,
-                    'text_simplified': highlighted_simplified,
-                    'text_uthmani': highlighted_uthmani,
-                    'chapter': self.get_chapter_name(surah)
-                })
-        
         return results, total_occurrences
 
     def get_verse(self, surah, ayah, version='simplified'):
@@ -365,16 +505,16 @@ class QuranSearch:
         return True, ""
     
     def search_by_surah(self, surah,is_dark_theme=False, highlight_words=[]):
-        results = []
-
         """Retrieve all verses of a given Surah."""
+        results = []
+        normalized_verses = self._get_normalized_verses()
+        normalized_words = [(word, self._normalize_text(word)) for word in highlight_words]
         for ayah in range(1, self.get_verse_count(surah) + 1):
             uthmani_text = self._uthmani.get((surah, ayah), {}).get('text', '')
             simplified_text = self._simplified.get((surah, ayah), {}).get('text', '')
-            original_simplified_text = simplified_text
-            for word in highlight_words:
-                normalized_query = self._normalize_text(word)
-                if normalized_query in self._normalize_text(original_simplified_text):
+            normalized_simplified = normalized_verses.get((surah, ayah), '')
+            for word, normalized_query in normalized_words:
+                if normalized_query in normalized_simplified:
 
                     # Pass highlight_words to the highlight method
                     simplified_text = self._highlight_search(
@@ -396,15 +536,16 @@ class QuranSearch:
     def search_by_surah_ayah(self, surah, first, last=None,is_dark_theme=False, highlight_words=[]):
         """Retrieve a specific verse by Surah and Ayah number."""
         results = []
+        normalized_verses = self._get_normalized_verses()
+        normalized_words = [(word, self._normalize_text(word)) for word in highlight_words]
         if last is None:
             last = first
         for ayah in range(first, last + 1):
             uthmani_text = self._uthmani.get((surah, ayah), {}).get('text', '')
             simplified_text = self._simplified.get((surah, ayah), {}).get('text', '')
-            original_simplified_text = simplified_text
-            for word in highlight_words:
-                normalized_query = self._normalize_text(word)
-                if normalized_query in self._normalize_text(original_simplified_text):
+            normalized_simplified = normalized_verses.get((surah, ayah), '')
+            for word, normalized_query in normalized_words:
+                if normalized_query in normalized_simplified:
 
                     # Pass highlight_words to the highlight method
                     simplified_text = self._highlight_search(
@@ -474,15 +615,10 @@ class QuranSearch:
         with the matching verse highlighted.
         """
         # Parse the search query
-        search_params = self._parse_search_query(query)
-        term = search_params['term']
-        preserve_hamza = search_params['preserve_hamza']
-        
-        normalized_query = self._normalize_text(term, preserve_hamza)
+        _, _, preserve_hamza, normalized_query = self._parse_search_query(query)
         results = []
         
-        for (surah, ayah), data in self._simplified.items():
-            normalized_text = self._normalize_text(data['text'], preserve_hamza)
+        for (surah, ayah), normalized_text in self._get_normalized_verses(preserve_hamza).items():
             if normalized_query in normalized_text:
                 context_list = self.get_ayah_with_context(surah, ayah)
                 for r in context_list:
@@ -492,12 +628,10 @@ class QuranSearch:
     
     def get_all_simplified_words(self):
         """Return unique words from simplified Quran text with counts"""
-        word_counts = {}
-        for (surah, ayah), data in self._simplified.items():
-            text = self._normalize_text(data['text'])
-            for word in text.split():
-                word_counts[word] = word_counts.get(word, 0) + 1
-        
+        postings = self._get_word_index()[0]
+        word_counts = {word: sum(count for _, count in verses)
+                       for word, verses in postings.items()}
+
         # Sort by frequency then alphabetically
         return sorted(word_counts.keys(), 
                     key=lambda x: (-word_counts[x], x))
@@ -512,21 +646,17 @@ class QuranSearch:
         highlighted = self._highlight_search(text, query, is_dark_theme)
         
         # Then apply permanent word highlights
+        normalized_query = self._normalize_text(query)
         for word in highlight_words:
-            if self._normalize_text(word) == self._normalize_text(query):
+            if self._normalize_text(word) == normalized_query:
                 continue
             highlighted = self._highlight_search(highlighted, word, is_dark_theme)
         return highlighted
 
     def _highlight_search(self, text, query, is_dark_theme):
         # Parse the search query to handle special operators
-        search_params = self._parse_search_query(query)
-        term = search_params['term']
-        pattern_type = search_params['pattern_type']
-        preserve_hamza = search_params['preserve_hamza']
-        
-        normalized_query = self._normalize_text(term, preserve_hamza)
-        
+        term, pattern_type, preserve_hamza, _ = self._parse_search_query(query)
+
         if pattern_type == 'substring':
             return self.highlight_phrase(text, term, is_dark_theme)
         else:
@@ -538,14 +668,10 @@ class QuranSearch:
         highlight_color = "#FFFF00" if is_dark_theme else "#ff0000"
         normalized_query = self._normalize_text(query, preserve_hamza)
         
-        # Split text into words while preserving original whitespace
-        words = text.split()
+        # Words paired with their normalized form (same hamza preservation as search)
         highlighted = []
         
-        for original_word in words:
-            # Normalize the current word (with same hamza preservation as search)
-            normalized_word = self._normalize_text(original_word, preserve_hamza)
-            
+        for original_word, normalized_word in self._tokenize_words(text, preserve_hamza):
             # Check if word matches the pattern
             match = False
             if pattern_type == 'starts_with':
@@ -570,14 +696,10 @@ class QuranSearch:
 
         normalized_query = self._normalize_text(query)
         
-        # Split text into words while preserving original whitespace
-        words = text.split()
+        # Words paired with their normalized form
         highlighted = []
         
-        for original_word in words:
-            # Normalize the current word
-            normalized_word = self._normalize_text(original_word)
-            
+        for original_word, normalized_word in self._tokenize_words(text):
             # Check if query is a substring of the normalized word
             if normalized_query in normalized_word:
                 highlighted.append(
@@ -599,15 +721,9 @@ class QuranSearch:
         word_boundaries = self._get_word_boundaries(text)
         
         # Normalize each character and build index mapping
-        normalized_chars = []
-        index_mapping = []
-        for idx, char in enumerate(text):
-            nc = self._normalize_char(char)
-            if nc:
-                for c in nc:
-                    normalized_chars.append(c)
-                    index_mapping.append(idx)
-        normalized_text = ''.join(normalized_chars)
+        pieces = [_PHRASE_CHAR_TABLE[ord(char)] for char in text]
+        normalized_text = ''.join(pieces)
+        index_mapping = [idx for idx, piece in enumerate(pieces) for _ in piece]
 
         result = []
         last_highlight_end = 0
@@ -666,9 +782,7 @@ class QuranSearch:
 
     def _normalize_char(self, char):
         """Normalize a single character (helper for highlight_phrase)."""
-        char = self._remove_diacritics(char)
-        char = self._normalize_hamza(char)
-        return char
+        return _PHRASE_CHAR_TABLE[ord(char)]
 
 
 class QuranWordCache:
@@ -0,0 +1,114 @@
+"""
+Regression tests for QuranSearch: the indexed / batched search paths must
+give exactly what a plain per-verse scan of the corpus gives.
+"""
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from models.search_engine import QuranSearch
+
+
+QUERIES = [
+    # substring
+    "الله", "الرحمن", "بسم الله", "يا ايها", "الصلوه", "ال", "ن",
+    # %x% / #x exact word
+    "%الله%", "#الله", "#من",
+    # x% starts with
+    "قال%", "لله%", "رب%",
+    # %x ends with
+    "%ون", "%ين",
+    # @ keeps hamza
+    "@أ", "@إن", "@أنزل%", "#@إن",
+]
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    cache_dir = tmp_path_factory.mktemp("normalized_cache")
+    search = QuranSearch()
+    # Keep the on-disk normalized corpus cache out of the user's AppData
+    search._normalized_cache_dir = lambda: cache_dir
+    return search
+
+
+def reference_matches(engine, query, keys):
+    """Per-verse scan used before the word index: [(surah, ayah)], total"""
+    term, pattern_type, preserve_hamza, _ = engine._parse_search_query(query)
+    normalized_query = QuranSearch._normalize_text.__wrapped__(term, preserve_hamza)
+
+    matches = []
+    total = 0
+    for key in keys:
+        text = QuranSearch._normalize_text.__wrapped__(engine._simplified[key]['text'], preserve_hamza)
+        words = text.split()
+        if pattern_type == 'substring':
+            occurrences = text.count(normalized_query) if normalized_query in text else 0
+        elif pattern_type == 'starts_with':
+            occurrences = sum(word.startswith(normalized_query) for word in words)
+        elif pattern_type == 'ends_with':
+            occurrences = sum(word.endswith(normalized_query) for word in words)
+        else:
+            occurrences = sum(word == normalized_query for word in words)
+        if occurrences:
+            matches.append(key)
+            total += occurrences
+    return matches, total
+
+
+def test_parsed_query_is_immutable(engine):
+    parsed = engine._parse_search_query("@أنزل%")
+    assert parsed == ("أنزل", "starts_with", True, QuranSearch._normalize_text("أنزل", True))
+    with pytest.raises(AttributeError):
+        parsed.term = "x"
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_search_verses_matches_full_scan(engine, query):
+    results, total = engine.search_verses(query, highlight=False)
+    expected, expected_total = reference_matches(engine, query, list(engine._simplified))
+    assert [(r['surah'], r['ayah']) for r in results] == expected
+    assert total == expected_total
+
+
+@pytest.mark.parametrize("query", QUERIES)
+@pytest.mark.parametrize("surah", [1, 2, 112])
+def test_search_in_surah_matches_full_scan(engine, query, surah):
+    results, total = engine.search_in_surah(query, surah, highlight=False)
+    keys = [key for key in engine._simplified if key[0] == surah]
+    expected, expected_total = reference_matches(engine, query, keys)
+    assert [(r['surah'], r['ayah']) for r in results] == expected
+    assert total == expected_total
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_highlighting_keeps_plain_results(engine, query):
+    highlighted, total = engine.search_verses(query)
+    plain, plain_total = engine.search_verses(query, highlight=False)
+    assert [(r['surah'], r['ayah']) for r in highlighted] == [(r['surah'], r['ayah']) for r in plain]
+    assert total == plain_total
+
+
+@pytest.mark.parametrize("preserve_hamza", [False, True])
+def test_batch_normalization_matches_per_verse(engine, preserve_hamza):
+    normalized = engine._get_normalized_verses(preserve_hamza)
+    for key, data in engine._simplified.items():
+        assert normalized[key] == QuranSearch._normalize_text.__wrapped__(data['text'], preserve_hamza)
+
+
+@pytest.mark.parametrize("preserve_hamza", [False, True])
+def test_tokenized_words_match_per_word_normalization(engine, preserve_hamza):
+    for corpus in (engine._simplified, engine._uthmani):
+        for data in corpus.values():
+            tokens = QuranSearch._tokenize_words(data['text'], preserve_hamza)
+            assert [original for original, _ in tokens] == data['text'].split()
+            for original, normalized in tokens:
+                assert normalized == QuranSearch._normalize_text.__wrapped__(original, preserve_hamza)
+
+
+def test_common_words_count_every_occurrence(engine):
+    counts = {}
+    for text in engine._get_normalized_verses().values():
+        for word in text.split():
+            counts[word] = counts.get(word, 0) + 1
+    assert engine.get_all_simplified_words() == sorted(counts, key=lambda word: (-counts[word], word))
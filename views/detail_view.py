@@ -4,9 +4,9 @@ from views.widgets.notes_widget import NotesWidget
 class DetailView(QtWidgets.QWidget):
     backRequested = QtCore.pyqtSignal()
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, db=None):
         super().__init__(parent)
-        self.notes_widget = NotesWidget()
+        self.notes_widget = NotesWidget(db=db)
         self.notes_widget.back_button.clicked.connect(self.handle_back_requested)
         self.initUI()
 
@@ -579,7 +579,7 @@ class AyahSelectorDialog(QtWidgets.QDialog):
                 output.extend(verse_texts)
                 
             elif item['type'] == 'search':
-                results = search_engine.search_verses(item['query'])
+                results, _ = search_engine.search_verses(item['query'], highlight=False)
                 output.extend(["========================================================================",])
                 output.extend([f"بحث عن : {item['query']}",])
                 output.extend(["========================================================================",])
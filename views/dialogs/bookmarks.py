@@ -118,8 +118,5 @@ class BookmarkDialog(QtWidgets.QDialog):
             bm = self.model.data(index, QtCore.Qt.UserRole)
             self.parent.db.delete_bookmark(bm['surah'], bm['ayah'])
             
-            self.model.beginRemoveRows(QtCore.QModelIndex(), row, row)
-            del self.model._bookmarks[row]
-            self.model._loaded_count = min(self.model._loaded_count, len(self.model._bookmarks))
-            self.model.endRemoveRows()
+            self.model.remove_bookmark(row)
 
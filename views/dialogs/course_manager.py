@@ -615,7 +615,7 @@ class CourseManagerDialog(QtWidgets.QDialog):
     def load_initial_courses(self):
         """Load first course or create new one"""
         if self.db.has_any_courses():
-            courses = self.db.get_all_courses()
+            courses = self.db.get_all_course_titles()
             if courses:
                 self.load_course(courses[0][0])
         else:
@@ -669,7 +669,7 @@ class CourseManagerDialog(QtWidgets.QDialog):
         self.course_combo.blockSignals(True)
         self.course_combo.clear()
         
-        courses = self.db.get_all_courses()
+        courses = self.db.get_all_course_titles()
         for course in courses:
             course_id = course[0]
             title = course[1]
@@ -903,7 +903,7 @@ class CourseManagerDialog(QtWidgets.QDialog):
         self.db.delete_course(course_id)
         
         # Load another course or create a new one
-        courses = self.db.get_all_courses()
+        courses = self.db.get_all_course_titles()
         if courses:
             # Load the first available course
             self.load_course(courses[0][0])
@@ -945,9 +945,8 @@ class CourseManagerDialog(QtWidgets.QDialog):
         if not self.check_unsaved_changes():
             return
 
-        prev_info = self.db.get_previous_course(self.current_course['id'])
-        if prev_info:
-            prev_id, _ = prev_info
+        prev_id, _ = self.db.get_adjacent_course_ids(self.current_course['id'])
+        if prev_id:
             self.load_course(prev_id)
             self.update_navigation_buttons()
 
@@ -958,19 +957,17 @@ class CourseManagerDialog(QtWidgets.QDialog):
         if not self.check_unsaved_changes():
             return  
 
-        next_info = self.db.get_next_course(self.current_course['id'])
-        if next_info:
-            next_id, _ = next_info
+        _, next_id = self.db.get_adjacent_course_ids(self.current_course['id'])
+        if next_id:
             self.load_course(next_id)
             self.update_navigation_buttons()
 
     def update_navigation_buttons(self):
         """Properly update button states"""
         if self.current_course:
-            has_prev = self.db.has_previous_course(self.current_course['id'])
-            has_next = self.db.has_next_course(self.current_course['id'])
-            self.prev_btn.setEnabled(has_prev)
-            self.next_btn.setEnabled(has_next)
+            prev_id, next_id = self.db.get_adjacent_course_ids(self.current_course['id'])
+            self.prev_btn.setEnabled(prev_id is not None)
+            self.next_btn.setEnabled(next_id is not None)
         else:
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)    
@@ -1161,7 +1158,7 @@ class CourseManagerDialog(QtWidgets.QDialog):
     def show_search_results(self, query):
         """Show actual search results in preview"""
         import re
-        results, _ = self.search_engine.search_verses(query)
+        results, _ = self.search_engine.search_verses(query, highlight=False)
         output = []
         
         for verse in results:
@@ -1463,7 +1460,7 @@ class CourseManagerDialog(QtWidgets.QDialog):
                     output.append(text)
             elif item_type == 'search':
                 query = item.get('query', '')
-                results, _ = search_engine.search_verses(query)
+                results, _ = search_engine.search_verses(query, highlight=False)
                 output.extend(["========================================================================",])
                 output.extend([f"بحث عن : {query}",])
                 output.extend(["========================================================================", ""])
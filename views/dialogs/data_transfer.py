@@ -221,19 +221,14 @@ class DataTransferDialog(QtWidgets.QDialog):
                             self.update_progress(f"Invalid items format in course '{title}' - skipping")
                             continue
                         
-                        # Normalize items JSON
-                        try:
-                            normalized_items = json.loads(json.dumps(items, sort_keys=True))
-                        except Exception as e:
-                            self.update_progress(f"Invalid course format: {str(e)}")
-                            continue
-                            
-                        if self.db.items_exist(normalized_items):
+                        # Items were just parsed from JSON, so they serialize as-is;
+                        # DbManager applies the canonical key order itself
+                        if self.db.items_exist(items):
                             self.update_progress(f"Skipped duplicate content course: '{title}'")
                             continue
                             
                         # Check for title conflicts
-                        existing_titles = [c[1] for c in self.db.get_all_courses()]
+                        existing_titles = {c[1] for c in self.db.get_all_course_titles()}
                         new_title = title
                         counter = 1
                         while new_title in existing_titles:
@@ -241,7 +236,7 @@ class DataTransferDialog(QtWidgets.QDialog):
                             counter += 1
                             
                         # Save with deduplicated title
-                        self.db.save_course(None, new_title, normalized_items)
+                        self.db.save_course(None, new_title, items)
                         self.update_progress(f"Added new course: '{new_title}'")
                     self.coursesChanged.emit()
 
@@ -1,6 +1,6 @@
 
 import os
-import time
+import logging
 from pathlib import Path
 
 from PyQt5 import QtWidgets, QtCore, QtGui
@@ -57,12 +57,21 @@ class HelpDialog(QtWidgets.QDialog):
         self.setWindowModality(QtCore.Qt.NonModal)
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)
         
-        layout = QtWidgets.QVBoxLayout(self)
+        self.body_layout = QtWidgets.QVBoxLayout(self)
+        self.web_view = None  # built lazily on first show
+
+    def _build_body(self):
+        """Create the web view once the dialog frame is already on screen."""
+        if self.web_view is not None:
+            return
         self.web_view = QWebEngineView(self)
         self.web_view.setPage(CustomWebEnginePage(self.web_view))
-        layout.addWidget(self.web_view)
+        self.body_layout.addWidget(self.web_view)
+        self.load_content()
         
     def load_content(self):
+        if self.web_view is None:
+            return
         dark_mode = self.parent.theme_action.isChecked() if self.parent else False
         content = self._cache.get_content(dark_mode)
         self.web_view.page().setBackgroundColor(QColor("#333" if dark_mode else "#FFF"))
@@ -70,12 +79,18 @@ class HelpDialog(QtWidgets.QDialog):
         self.web_view.setHtml(content, base_url)
         
     def toggle_theme(self, dark_mode):
+        if self.web_view is None:
+            return
         self.web_view.page().setBackgroundColor(QColor("#333" if dark_mode else "#FFF"))
         self.load_content()
         
     def showEvent(self, event):
-        self.load_content()
         super().showEvent(event)
+        if self.web_view is None:
+            # Let the window chrome paint first, fill the body one tick later
+            QtCore.QTimer.singleShot(0, self._build_body)
+        else:
+            self.load_content()
 
 
 
@@ -107,9 +122,12 @@ class HelpCacheManager:
     
     @classmethod
     def get_content(cls, dark_mode=False):
-        # Refresh content every 5 minutes
-        if time.time() - cls._last_modified > 300:
-            cls._load_content()
+        # Re-read only when the help file changed on disk since the last load
+        try:
+            if cls._file_path.stat().st_mtime != cls._last_modified:
+                cls._load_content()
+        except OSError:
+            pass
             
         return cls._dark_content if dark_mode else cls._content
 
@@ -6,60 +6,9 @@ import logging
 from datetime import datetime
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+from views.dialogs.word_dictionary import DefinitionHighlighter
 
 
-class DefinitionHighlighter(QtGui.QSyntaxHighlighter):
-    def __init__(self, document, is_dark_theme):
-        super().__init__(document)
-
-        # Invisible marker format
-        self.hidden_format = QtGui.QTextCharFormat()
-        self.hidden_format.setForeground(QtCore.Qt.transparent)
-
-        self.is_dark_theme = is_dark_theme
-
-        # Determine note color based on theme
-        if is_dark_theme:
-            note_fg = "#D66A2C"       # orange for dark background
-            note_bg = None
-        else:
-            note_fg = "#9C2A00"   # deep burnt-orange, low saturation, easy on the eyes
-            note_bg = "#FFF3E8"   # very light warm background, barely noticeable but guides the eye
-
-        # Marker → format mapping
-        self.rules = {
-            "**": self._make_format("#1565C0", bold=True),   # main header
-            "##": self._make_format("#2E7D32", bold=True),   # sub header
-            "--": self._make_format(fg=note_fg, bg=note_bg, bold=False),  # note
-            "!!": self._make_format("#C62828", bold=True),   # warning
-        }
-
-    def _make_format(self, fg, bg=None, bold=False):
-        fmt = QtGui.QTextCharFormat()
-        fmt.setForeground(QtGui.QColor(fg))
-        if bg:
-            fmt.setBackground(QtGui.QColor(bg))
-            fmt.setProperty(QtGui.QTextFormat.FullWidthSelection, True)
-        if bold:
-            fmt.setFontWeight(QtGui.QFont.Bold)
-        return fmt
-
-    def highlightBlock(self, text):
-        for marker, fmt in self.rules.items():
-            if text.startswith(marker):
-                marker_len = len(marker)
-
-                # Hide marker
-                self.setFormat(0, marker_len, self.hidden_format)
-
-                # Style rest of line
-                self.setFormat(
-                    marker_len,
-                    len(text) - marker_len,
-                    fmt
-                )
-                break
-
 class NotesManagerDialog(QtWidgets.QDialog):
     show_ayah_requested = QtCore.pyqtSignal(int, int)  # Surah, Ayah
 
@@ -85,8 +85,8 @@ class CourseSelectionDialog(QtWidgets.QDialog):
 
     def load_courses(self):
         self.course_list.clear()
-        courses = self.db.get_all_courses()
-        for course_id, title, _ in courses:
+        courses = self.db.get_all_course_titles()
+        for course_id, title in courses:
             item = QtWidgets.QListWidgetItem(title)
             item.setData(Qt.UserRole, course_id)
             self.course_list.addItem(item)
@@ -71,6 +71,7 @@ class QuranBrowser(QtWidgets.QMainWindow):
         self.audio_controller = AudioController(self)
 
         self.db = DbManager()
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.db.close)
 
         self.pinned_verses = self.db.get_active_pinned_verses()
 
@@ -84,7 +85,6 @@ class QuranBrowser(QtWidgets.QMainWindow):
         self.trigger_initial_search()
 
         self.model.loading_started.connect(self.handle_loading_started)
-        self.model.loading_progress.connect(self.handle_loading_progress)
         self.model.loading_complete.connect(self.handle_loading_complete)
         
         self.original_style = self.result_count.styleSheet()
@@ -242,13 +242,16 @@ class QuranBrowser(QtWidgets.QMainWindow):
         self.results_view.setModel(self.model)
         self.delegate = None 
         self.results_view.setUniformItemSizes(False)
+        # Lay out large result sets incrementally instead of feeding rows in by timer
+        self.results_view.setLayoutMode(QtWidgets.QListView.Batched)
+        self.results_view.setBatchSize(150)
         self.results_view.activated.connect(self.show_detail_view)
         self.results_view.setWordWrap(True)
         self.results_view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.results_view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)  
 
 
-        self.detail_view = DetailView()
+        self.detail_view = DetailView(db=self.db)
         self.splitter.addWidget(self.results_view)
         self.splitter.addWidget(self.detail_view)
 
@@ -759,13 +762,6 @@ class QuranBrowser(QtWidgets.QMainWindow):
     def handle_loading_started(self, total_results):
         self.showMessage(f"Loading {total_results} results...", 0)  # 0 = indefinite
 
-    def handle_loading_progress(self, loaded, total, remaining):
-        self.showMessage(
-            f"Loaded {loaded} of {total} results ({remaining} remaining)", 
-            2500,  # Brief message
-            bg="#2196F3"  # Blue background for progress
-        )
-
     def handle_loading_complete(self, total):
         self.showMessage(f"All {total} results loaded!", 3000, bg="#4CAF50")
 
@@ -1148,8 +1144,9 @@ class QuranBrowser(QtWidgets.QMainWindow):
         try:
             is_dark_theme = self.theme_action.isChecked()
             results = self.search_engine.search_by_surah(surah, is_dark_theme, self.highlight_words)
+            noted = self.db.get_noted_verses((r['surah'], r['ayah']) for r in results)
             for result in results:
-                if self.db.has_note(result['surah'], result['ayah']):
+                if (result['surah'], result['ayah']) in noted:
                     bullet = "<span style='font-size:32px;'>•</span> "
                     result['text_simplified'] = bullet + result['text_simplified']
                     result['text_uthmani'] = bullet + result['text_uthmani']
@@ -1186,8 +1183,9 @@ class QuranBrowser(QtWidgets.QMainWindow):
         try:
             is_dark_theme = self.theme_action.isChecked()
             results = self.search_engine.search_by_surah(surah, is_dark_theme, self.highlight_words)
+            noted = self.db.get_noted_verses((r['surah'], r['ayah']) for r in results)
             for result in results:
-                if self.db.has_note(result['surah'], result['ayah']):
+                if (result['surah'], result['ayah']) in noted:
                     bullet = "<span style='font-size:32px;'>•</span> "
                     result['text_simplified'] = bullet + result['text_simplified']
                     result['text_uthmani'] = bullet + result['text_uthmani']
@@ -1584,8 +1582,6 @@ class QuranBrowser(QtWidgets.QMainWindow):
         
         if not found and self.scroll_retries < self.MAX_SCROLL_RETRIES:
             self.scroll_retries += 1
-            # Load more results and try again
-            self.model.load_remaining_results()
             QtCore.QTimer.singleShot(100, self.handle_pending_scroll)
         else:
             self.pending_scroll = None
@@ -1596,7 +1592,7 @@ class QuranBrowser(QtWidgets.QMainWindow):
                 pass 
 
     def _scroll_to_ayah(self, surah, ayah):
-        """Enhanced scroll function with progressive loading"""
+        """Select and center the row for surah/ayah; returns False if it is not listed"""
         self.results_view.selectionModel().clearSelection()
         
         # First try non-pinned items (actual results) when in surah view
@@ -1626,21 +1622,17 @@ class QuranBrowser(QtWidgets.QMainWindow):
                     self.results_view.scrollTo(index, 
                         QtWidgets.QAbstractItemView.PositionAtCenter)
                     return True
-                    
-        # If still not found, check if more results need loading
-        if self.model._displayed_results < len(self.model.results):
-            self.model.load_remaining_results()
-            
+
         return False
 
     def _add_search_to_course(self, course_id, query):
         """Add a search query to a course"""
-        courses = self.db.get_all_courses()
-        course = next((c for c in courses if c[0] == course_id), None)
+        # Decode only the target course, not every course's items
+        course = self.db.get_course(course_id)
         if not course:
             return
 
-        _, title, items = course
+        title, items = course['title'], course['items']
         updated_items = items.copy()
         
         # Create search item
@@ -1794,12 +1786,12 @@ class QuranBrowser(QtWidgets.QMainWindow):
                 })
 
         # Add entries to course
-        courses = self.db.get_all_courses()
-        course = next((c for c in courses if c[0] == course_id), None)
+        # Decode only the target course, not every course's items
+        course = self.db.get_course(course_id)
         if not course:
             return
 
-        _, title, items = course
+        title, items = course['title'], course['items']
         updated_items = items.copy()
 
         for entry in entries:
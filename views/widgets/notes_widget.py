@@ -5,9 +5,10 @@ from models.database import DbManager
 from models.search_engine import QuranSearch
 
 class NotesWidget(QtWidgets.QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, db=None):
         super().__init__(parent)
-        self.db = DbManager()
+        # Share the main window's connection when given one
+        self.db = db if db is not None else DbManager()
         self.current_surah = None
         self.current_ayah = None
         self.original_content = ""